@@ -0,0 +1 @@
+# Lets bare `pytest` import yield_curve_analyzer from the repo root
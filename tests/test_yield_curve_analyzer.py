@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import yield_curve_analyzer as yca
+
+
+# 2s10s spreads covering the edge cases of the inversion scan
+SPREAD_CASES = {
+    'trailing_inversion': [0.5, -0.2, 0.1, -0.3, -0.4],
+    'nan_inside_run': [0.5, -0.2, np.nan, -0.3, 0.2],
+    'all_nan': [np.nan, np.nan, np.nan],
+    'single_value': [-1.0],
+    'empty': [],
+}
+
+
+def _assert_same_periods(actual, expected):
+    for got, want in zip(actual, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+@pytest.mark.parametrize('spread', SPREAD_CASES.values(), ids=SPREAD_CASES.keys())
+def test_scan_loop_matches_numpy(spread):
+    spread = np.asarray(spread, dtype=np.float32)
+    _assert_same_periods(yca._scan_inversions_loop(spread), yca._scan_inversions_numpy(spread))
+
+
+@pytest.mark.parametrize('spread', SPREAD_CASES.values(), ids=SPREAD_CASES.keys())
+def test_compiled_scan_matches_numpy(spread):
+    pytest.importorskip('numba')
+    yca._load_kernels()
+    spread = np.asarray(spread, dtype=np.float32)
+    _assert_same_periods(yca._scan_inversions_impl(spread), yca._scan_inversions_numpy(spread))
+
+
+def test_report_follows_replaced_data(capsys):
+    analyzer = yca.YieldCurveAnalyzer()
+    ten_y = np.array([1.0] * 5 + [3.0] * 5, dtype=np.float32)
+    analyzer.data = pd.DataFrame({
+        '2Y_estimated': np.full(10, 2.0, dtype=np.float32),
+        '5Y': ten_y,
+        '10Y': ten_y,
+        '30Y': ten_y
+    }, index=pd.bdate_range('2024-01-01', periods=10))
+    analyzer.calculate_spreads()
+
+    # Drop the inverted rows
+    analyzer.data = analyzer.data.iloc[5:]
+    capsys.readouterr()
+    analyzer.analyze_inversions()
+    analyzer.generate_summary_report()
+    output = capsys.readouterr().out
+
+    assert "No yield curve inversions detected" in output
+    assert "Minimum spread: 1.00 bp" in output
+
+
+def test_report_follows_in_place_edits(capsys):
+    analyzer = yca.YieldCurveAnalyzer()
+    ten_y = np.full(10, 3.0, dtype=np.float32)
+    analyzer.data = pd.DataFrame({
+        '2Y_estimated': np.full(10, 2.0, dtype=np.float32),
+        '5Y': ten_y,
+        '10Y': ten_y,
+        '30Y': ten_y
+    }, index=pd.bdate_range('2024-01-01', periods=10))
+    analyzer.calculate_spreads()
+
+    # Invert the curve for two days without replacing the frame
+    analyzer.data.loc[analyzer.data.index[3:5], '2s10s_spread'] = -0.5
+    capsys.readouterr()
+    analyzer.analyze_inversions()
+    analyzer.generate_summary_report()
+    output = capsys.readouterr().out
+
+    assert "Number of inversion periods: 1" in output
+    assert "Start: 2024-01-04" in output
+    assert "Minimum spread: -0.50 bp" in output
+
+
+def test_short_series_skip_numba(monkeypatch):
+    def fail():
+        raise AssertionError("numba kernels loaded for a short series")
+
+    monkeypatch.setattr(yca, '_load_kernels', fail)
+    starts, ends = yca._scan_inversions(np.array([1.0, -1.0, 1.0]))
+    np.testing.assert_array_equal(starts, [1])
+    np.testing.assert_array_equal(ends, [2])
@@ -1,16 +1,100 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import argparse
 from datetime import datetime, timedelta
-import yfinance as yf
-import requests
+import functools
+import hashlib
+import io
+import os
+import tempfile
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set up plotting style
-plt.style.use('seaborn-v0_8')
-plt.rcParams['figure.figsize'] = (12, 8)
+# Downloaded data is reused for an hour so re-runs don't hit the network again
+CACHE_DIR = 'yf_cache'
+CACHE_EXPIRY_SECONDS = 3600
+
+# Importing numba and loading its compiled scan takes ~0.3 s, while the NumPy
+# scan handles ~10 million points in ~20 ms, so only go to numba for series
+# long enough that the compiled loop can win that time back
+NUMBA_MIN_LENGTH = 100_000_000
+
+def _scan_inversions_numpy(spread):
+    """
+    Find runs where the spread is negative.
+    Returns (starts, ends) index arrays; each end is one past the run.
+    """
+    # Rising/falling edges of the inverted mask mark where each period starts/ends
+    mask = (spread < 0).astype(np.int8)
+    edges = np.diff(np.r_[0, mask, 0])
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _scan_inversions_loop(spread):
+    """
+    Loop version of _scan_inversions_numpy, compiled by _load_kernels
+    for long histories
+    """
+    n = spread.shape[0]
+    starts = np.empty(n // 2 + 1, dtype=np.int64)
+    ends = np.empty(n // 2 + 1, dtype=np.int64)
+    count = 0
+    in_inversion = False
+    
+    for i in range(n):
+        is_inverted = spread[i] < 0
+        if is_inverted and not in_inversion:
+            # Start of inversion
+            in_inversion = True
+            starts[count] = i
+        elif not is_inverted and in_inversion:
+            # End of inversion
+            in_inversion = False
+            ends[count] = i
+            count += 1
+    
+    # Handle case where we're still in inversion
+    if in_inversion:
+        ends[count] = n
+        count += 1
+    
+    return starts[:count], ends[:count]
+
+
+# NumPy version until _load_kernels swaps in the numba-compiled loop
+_scan_inversions_impl = _scan_inversions_numpy
+_kernels_loaded = False
+
+
+def _load_kernels():
+    """
+    Compile the loop version with numba on first use, so importing this
+    module doesn't pay for importing numba. Keeps the NumPy version if
+    numba isn't installed.
+    """
+    global _scan_inversions_impl, _kernels_loaded
+    if _kernels_loaded:
+        return
+    _kernels_loaded = True
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    
+    _scan_inversions_impl = njit(cache=True)(_scan_inversions_loop)
+
+
+def _scan_inversions(spread):
+    """
+    Find inversion periods, returning (starts, ends) index arrays
+    """
+    if spread.shape[0] < NUMBA_MIN_LENGTH:
+        return _scan_inversions_numpy(spread)
+    _load_kernels()
+    return _scan_inversions_impl(spread)
+
 
 class YieldCurveAnalyzer:
     """
@@ -23,9 +107,79 @@ class YieldCurveAnalyzer:
     - When yield curves invert (recession indicator)
     """
     
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.data = None
         self.fed_funds_rate = None
+        self.verbose = verbose  # Print step-by-step progress while fetching
+        
+        self._session = None
+        
+    def _get_session(self):
+        """
+        Cache FRED responses locally so re-runs don't download again.
+        Returns None if requests-cache isn't installed.
+        
+        Not used for Yahoo Finance: current yfinance rejects requests-cache
+        sessions, so its downloads are cached by _download_yields instead.
+        """
+        if self._session is None:
+            try:
+                import requests_cache
+            except ImportError:
+                return None
+            self._session = requests_cache.CachedSession('fred_cache', backend='sqlite',
+                                                         expire_after=CACHE_EXPIRY_SECONDS)
+        return self._session
+        
+    def _download_yields(self, tickers, start_date, end_date):
+        """
+        Download all tickers in one batched yfinance call, reusing a CSV
+        copy from CACHE_DIR if the same request was made within the last hour
+        """
+        cache_key = hashlib.md5(f"{','.join(tickers)}|{start_date}|{end_date}".encode()).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f'{cache_key}.csv')
+        
+        if (os.path.exists(cache_path)
+                and time.time() - os.path.getmtime(cache_path) < CACHE_EXPIRY_SECONDS):
+            try:
+                data = pd.read_csv(cache_path, header=[0, 1], index_col=0, parse_dates=True)
+                if self.verbose:
+                    print("✓ Using cached download")
+                return data
+            except Exception as e:
+                # A damaged cache file just means downloading again
+                print(f"⚠️  Ignoring unreadable cache file {cache_path}: {e}")
+        
+        import yfinance as yf
+        
+        data = yf.download(tickers, start=start_date, end=end_date,
+                           group_by='ticker', progress=False, threads=True)
+        
+        # Only cache complete downloads, so a partial failure isn't replayed for an hour
+        fetched_tickers = data.columns.get_level_values(0) if not data.empty else []
+        complete = all(ticker in fetched_tickers
+                       and 'Close' in data[ticker].columns
+                       and data[ticker]['Close'].notna().any()
+                       for ticker in tickers)
+        
+        # A failed cache write shouldn't throw away a good download
+        if complete:
+            tmp_path = None
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                
+                # Write to a temp file and swap it in, so concurrent runs never
+                # read a half-written cache file
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+                with os.fdopen(fd, 'w') as f:
+                    data.to_csv(f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"⚠️  Could not cache downloaded data: {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        
+        return data
         
     def fetch_treasury_data(self, start_date=None, end_date=None):
         """
@@ -42,8 +196,9 @@ class YieldCurveAnalyzer:
         if end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
             
-        print("Fetching Treasury yield data...")
-        print(f"Date range: {start_date} to {end_date}")
+        if self.verbose:
+            print("Fetching Treasury yield data...")
+            print(f"Date range: {start_date} to {end_date}")
         
         # Treasury yield tickers (Yahoo Finance)
         tickers = {
@@ -56,97 +211,90 @@ class YieldCurveAnalyzer:
         treasury_data = {}
         successful_fetches = []
         
-        for maturity, ticker in tickers.items():
-            try:
-                print(f"Attempting to fetch {maturity} ({ticker})...")
-                data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-                
-                if not data.empty and 'Close' in data.columns:
+        # Fetch all tickers in one batched request instead of one per maturity
+        try:
+            if self.verbose:
+                print(f"Attempting to fetch {list(tickers.keys())} ({', '.join(tickers.values())})...")
+            data = self._download_yields(list(tickers.values()), start_date, end_date)
+
+            if data.empty:
+                print("✗ Empty or invalid data returned")
+            else:
+                fetched_tickers = data.columns.get_level_values(0)
+                for maturity, ticker in tickers.items():
+                    if ticker not in fetched_tickers or 'Close' not in data[ticker].columns:
+                        print(f"✗ Empty or invalid data for {maturity}")
+                        continue
+
                     # Convert to Series and ensure we have valid data
-                    close_data = data['Close'].dropna()
+                    close_data = data[ticker]['Close'].dropna()
                     if len(close_data) > 0:
-                        # Ensure it's a proper Series with DatetimeIndex
-                        if not isinstance(close_data.index, pd.DatetimeIndex):
-                            close_data.index = pd.to_datetime(close_data.index)
                         treasury_data[maturity] = close_data
                         successful_fetches.append(maturity)
-                        print(f"✓ Successfully fetched {maturity} data ({len(close_data)} points)")
                     else:
                         print(f"✗ No valid close data for {maturity}")
-                else:
-                    print(f"✗ Empty or invalid data for {maturity}")
-                    
-            except Exception as e:
-                print(f"✗ Error fetching {maturity}: {str(e)}")
-        
-        print(f"\nSuccessfully fetched data for: {successful_fetches}")
+
+        except Exception as e:
+            print(f"✗ Error fetching treasury data: {str(e)}")
+
+        if self.verbose:
+            print(f"\nSuccessfully fetched data for: {successful_fetches}")
         
         # Only proceed if we have at least 2 series with data
         if len(treasury_data) >= 2:
             try:
-                print("Processing fetched data...")
-                
-                # Debug: Check what we actually have
-                for key, series in treasury_data.items():
-                    print(f"  {key}: {len(series)} points, index type: {type(series.index)}")
-                    print(f"    First few dates: {series.index[:3].tolist()}")
-                    print(f"    First few values: {series.head(3).values.flatten().tolist()}")
-                    print(f"    Data type: {type(series)}")
-                
-                # Ensure all series have datetime index
-                processed_data = {}
-                for maturity, series in treasury_data.items():
-                    # Convert index to datetime if it isn't already
-                    if not isinstance(series.index, pd.DatetimeIndex):
-                        series.index = pd.to_datetime(series.index)
-                    processed_data[maturity] = series
+                if self.verbose:
+                    print("Processing fetched data...")
+                    for key, series in treasury_data.items():
+                        print(f"  {key}: {len(series)} points")
                 
                 # Create DataFrame using outer join to handle different date ranges
-                print("Creating DataFrame from fetched series...")
+                if self.verbose:
+                    print("Creating DataFrame from fetched series...")
                 
                 # Method 1: Try direct DataFrame creation
                 try:
-                    self.data = pd.DataFrame(processed_data)
-                    print("✓ DataFrame created successfully with direct method")
+                    self.data = pd.DataFrame(treasury_data)
+                    if self.verbose:
+                        print("✓ DataFrame created successfully with direct method")
                 except Exception as e1:
                     print(f"✗ Direct method failed: {e1}")
                     
                     # Method 2: Try creating empty DataFrame and adding columns
                     try:
-                        # Get all unique dates
-                        all_dates = set()
-                        for series in processed_data.values():
-                            all_dates.update(series.index)
-                        all_dates = sorted(all_dates)
-                        
-                        # Create empty DataFrame with the date index
-                        self.data = pd.DataFrame(index=all_dates)
+                        # Get all unique dates (DatetimeIndex.union returns them sorted)
+                        all_dates = functools.reduce(
+                            lambda a, b: a.union(b),
+                            (series.index for series in treasury_data.values()))
                         
-                        # Add each series as a column
-                        for maturity, series in processed_data.items():
-                            self.data[maturity] = series
+                        # Align each series to the combined index
+                        self.data = pd.DataFrame({maturity: series.reindex(all_dates)
+                                                  for maturity, series in treasury_data.items()})
                             
-                        print("✓ DataFrame created successfully with manual method")
+                        if self.verbose:
+                            print("✓ DataFrame created successfully with manual method")
                     except Exception as e2:
                         print(f"✗ Manual method also failed: {e2}")
                         raise e2
                 
-                print(f"Initial data shape: {self.data.shape}")
-                print(f"Index type: {type(self.data.index)}")
+                if self.verbose:
+                    print(f"Initial data shape: {self.data.shape}")
                 
-                # Ensure index is datetime
+                # Ensure index is datetime (done once, on the assembled frame)
                 if not isinstance(self.data.index, pd.DatetimeIndex):
                     self.data.index = pd.to_datetime(self.data.index)
+                assert isinstance(self.data.index, pd.DatetimeIndex)
                 
                 # Clean the data - remove rows with all NaN values
                 initial_rows = len(self.data)
                 self.data = self.data.dropna(how='all')
-                print(f"Removed {initial_rows - len(self.data)} rows with all NaN values")
-                
-                print(f"After cleaning: {self.data.shape}")
+                if self.verbose:
+                    print(f"Removed {initial_rows - len(self.data)} rows with all NaN values")
+                    print(f"After cleaning: {self.data.shape}")
                 
                 # Fill forward any missing values (common in financial data)
-                self.data = self.data.fillna(method='ffill').fillna(method='bfill')
+                self.data.ffill(inplace=True)
+                self.data.bfill(inplace=True)
                 
                 # Create a better 2Y estimate if we don't have good 2Y data
                 # Note: ^IRX is actually 3-month Treasury, so we need to adjust
@@ -156,29 +304,36 @@ class YieldCurveAnalyzer:
                     if '5Y' in self.data.columns and '10Y' in self.data.columns:
                         # Estimate 2Y using typical yield curve relationships
                         # 2Y is usually between 3-month and 5Y, closer to 5Y
-                        three_month = self.data['2Y']  # This is actually 3-month
-                        five_year = self.data['5Y']
+                        three_month = self.data['2Y'].to_numpy()  # This is actually 3-month
+                        five_year = self.data['5Y'].to_numpy()
                         
                         # Linear interpolation: 2Y ≈ 3M + 0.7 * (5Y - 3M)
                         self.data['2Y_estimated'] = three_month + 0.7 * (five_year - three_month)
-                        print("✓ Created estimated 2Y yields from 3-month and 5Y data")
+                        if self.verbose:
+                            print("✓ Created estimated 2Y yields from 3-month and 5Y data")
                     else:
                         # Fallback: just use the 3-month as proxy
-                        self.data['2Y_estimated'] = self.data['2Y']
+                        self.data['2Y_estimated'] = self.data['2Y'].to_numpy()
                         print("⚠️  Using 3-month rate as 2Y proxy")
                 elif '5Y' in self.data.columns:
                     # If no 2Y data, estimate from 5Y
-                    self.data['2Y_estimated'] = self.data['5Y'] - 0.5
-                    print("✓ Estimated 2Y yields from 5Y data")
+                    self.data['2Y_estimated'] = self.data['5Y'].to_numpy() - 0.5
+                    if self.verbose:
+                        print("✓ Estimated 2Y yields from 5Y data")
+                
+                # Yields fit comfortably in float32; halves memory for stats and plotting
+                self.data = self.data.astype(np.float32)
+                assert self.data.dtypes.eq(np.float32).all()
                 
                 if not self.data.empty:
-                    print(f"✓ Final data shape: {self.data.shape}")
-                    print(f"✓ Date range: {self.data.index.min()} to {self.data.index.max()}")
-                    print(f"✓ Available columns: {list(self.data.columns)}")
+                    print(f"✓ Fetched {self.data.shape[0]} days of yields: {list(self.data.columns)}")
                     
-                    # Show some sample data
-                    print(f"✓ Sample data (last 3 rows):")
-                    print(self.data.tail(3))
+                    if self.verbose:
+                        print(f"✓ Date range: {self.data.index.min()} to {self.data.index.max()}")
+                        
+                        # Show some sample data
+                        print(f"✓ Sample data (last 3 rows):")
+                        print(self.data.tail(3))
                     
                     return True
                 else:
@@ -212,41 +367,27 @@ class YieldCurveAnalyzer:
             date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days
             
             # Create realistic treasury yields with some randomness
-            np.random.seed(42)  # For reproducible results
+            rng = np.random.default_rng(42)  # For reproducible results
             base_10y = 4.5  # Starting 10Y yield around current levels
-            
-            # Generate yields with realistic relationships and some time-series behavior
-            yields_10y = []
-            yields_5y = []
-            yields_2y = []
-            yields_30y = []
-            
-            current_10y = base_10y
-            
-            for i in range(len(date_range)):
-                # Add some random walk behavior
-                change = np.random.normal(0, 0.05)  # Small daily changes
-                current_10y += change
-                current_10y = max(1.0, min(7.0, current_10y))  # Keep in reasonable range
-                
-                # Create yield curve relationships
-                y_10 = current_10y
-                y_5 = y_10 - 0.3 + np.random.normal(0, 0.1)  # 5Y typically lower
-                y_2 = y_5 - 0.4 + np.random.normal(0, 0.1)   # 2Y typically lower still
-                y_30 = y_10 + 0.2 + np.random.normal(0, 0.1)  # 30Y typically higher
-                
-                yields_10y.append(y_10)
-                yields_5y.append(y_5)
-                yields_2y.append(y_2)
-                yields_30y.append(y_30)
-            
+            n = len(date_range)
+
+            # Add some random walk behavior, drawn for all days at once
+            changes = rng.normal(0, 0.05, n)  # Small daily changes
+            yields_10y = np.clip(base_10y + np.cumsum(changes), 1.0, 7.0)  # Keep in reasonable range
+
+            # Create yield curve relationships
+            noise_5y, noise_2y, noise_30y = rng.normal(0, 0.1, (3, n))
+            yields_5y = yields_10y - 0.3 + noise_5y    # 5Y typically lower
+            yields_2y = yields_5y - 0.4 + noise_2y     # 2Y typically lower still
+            yields_30y = yields_10y + 0.2 + noise_30y  # 30Y typically higher
+
             # Create DataFrame
             self.data = pd.DataFrame({
                 '2Y_estimated': yields_2y,
                 '5Y': yields_5y,
                 '10Y': yields_10y,
                 '30Y': yields_30y
-            }, index=date_range)
+            }, index=date_range, dtype=np.float32)
             
             print(f"✓ Created sample data with shape: {self.data.shape}")
             print("📝 Note: This is simulated data for learning purposes")
@@ -258,27 +399,40 @@ class YieldCurveAnalyzer:
     
     def fetch_fed_funds_rate(self):
         """
-        Fetch Federal Funds Rate data
-        We'll use a simple approach with available data
+        Fetch the daily effective Federal Funds Rate (DFF) from FRED
+        and align it to the treasury data dates
         """
+        if self.data is None:
+            print("No data available. Fetch data first!")
+            return
+        
         try:
-            # Using FRED data via a simple API call
             print("Fetching Fed Funds Rate data...")
             
-            # For now, we'll create a simple proxy
-            # In production, you'd use FRED API
-            dates = pd.date_range(start=self.data.index.min(), 
-                                end=self.data.index.max(), freq='D')
+            # One CSV download covering the whole analysis period
+            params = {
+                'id': 'DFF',
+                'cosd': self.data.index.min().strftime('%Y-%m-%d'),
+                'coed': self.data.index.max().strftime('%Y-%m-%d')
+            }
+            import requests
             
-            # Create a simplified fed funds rate (this is just for demonstration)
-            # In reality, you'd fetch this from FRED
-            fed_rate_values = np.random.uniform(4.5, 5.5, len(dates))  # Current range
+            session = self._get_session()
+            if session is None:
+                session = requests
+            response = session.get('https://fred.stlouisfed.org/graph/fredgraph.csv',
+                                   params=params, timeout=30)
+            response.raise_for_status()
             
-            self.fed_funds_rate = pd.Series(fed_rate_values, index=dates)
-            print("✓ Fed Funds Rate data created (demo version)")
+            # First column is the observation date; FRED marks missing values with '.'
+            fred_data = pd.read_csv(io.StringIO(response.text), index_col=0,
+                                    parse_dates=True, na_values='.')
+            
+            self.fed_funds_rate = fred_data['DFF'].dropna().reindex(self.data.index, method='ffill')
+            print("✓ Fed Funds Rate data fetched from FRED")
             
         except Exception as e:
-            print(f"✗ Error creating fed funds data: {str(e)}")
+            print(f"✗ Error fetching fed funds data: {str(e)}")
     
     def calculate_spreads(self):
         """
@@ -292,13 +446,18 @@ class YieldCurveAnalyzer:
             print("No data available. Fetch data first!")
             return
         
+        # Work on the raw arrays to skip pandas index alignment
+        yields = {col: self.data[col].to_numpy()
+                  for col in ['2Y_estimated', '5Y', '10Y', '30Y']
+                  if col in self.data.columns}
+        
         # Calculate 2s10s spread (10-year minus 2-year)
-        if '10Y' in self.data.columns and '2Y_estimated' in self.data.columns:
-            self.data['2s10s_spread'] = self.data['10Y'] - self.data['2Y_estimated']
+        if '10Y' in yields and '2Y_estimated' in yields:
+            self.data['2s10s_spread'] = yields['10Y'] - yields['2Y_estimated']
         
         # Calculate 5s30s spread  
-        if '30Y' in self.data.columns and '5Y' in self.data.columns:
-            self.data['5s30s_spread'] = self.data['30Y'] - self.data['5Y']
+        if '30Y' in yields and '5Y' in yields:
+            self.data['5s30s_spread'] = yields['30Y'] - yields['5Y']
             
         print("✓ Spreads calculated successfully!")
         
@@ -309,6 +468,13 @@ class YieldCurveAnalyzer:
         if self.data is None:
             print("No data to plot!")
             return
+        
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        
+        # Set up plotting style
+        plt.style.use('seaborn-v0_8')
+        plt.rcParams['figure.figsize'] = (12, 8)
             
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
         
@@ -317,21 +483,17 @@ class YieldCurveAnalyzer:
         maturity_labels = ['2Y_estimated', '5Y', '10Y', '30Y']
         
         # Select dates to show
-        recent_dates = self.data.index[-num_dates*20::20]  # Every 20th day for last num_dates
+        recent = self.data.iloc[-num_dates*20::20]  # Every 20th day for last num_dates
+        recent_dates = recent.index
+        
+        # One lookup for all curves; missing maturities come back as NaN
+        yields_mat = recent.reindex(columns=maturity_labels).to_numpy()
         
         colors = plt.cm.viridis(np.linspace(0, 1, len(recent_dates)))
         
         for i, date in enumerate(recent_dates):
-            if date in self.data.index:
-                yields = []
-                for label in maturity_labels:
-                    if label in self.data.columns:
-                        yields.append(self.data.loc[date, label])
-                    else:
-                        yields.append(np.nan)
-                
-                ax1.plot(maturities, yields, 'o-', color=colors[i], 
-                        label=f"{date.strftime('%Y-%m-%d')}", linewidth=2, markersize=6)
+            ax1.plot(maturities, yields_mat[i], 'o-', color=colors[i], 
+                    label=f"{date.strftime('%Y-%m-%d')}", linewidth=2, markersize=6)
         
         ax1.set_xlabel('Maturity (Years)')
         ax1.set_ylabel('Yield (%)')
@@ -373,26 +535,13 @@ class YieldCurveAnalyzer:
             return
             
         # Find inversion periods
-        inversions = self.data['2s10s_spread'] < 0
-        inversion_periods = []
-        
-        in_inversion = False
-        start_date = None
-        
-        for date, is_inverted in inversions.items():
-            if is_inverted and not in_inversion:
-                # Start of inversion
-                in_inversion = True
-                start_date = date
-            elif not is_inverted and in_inversion:
-                # End of inversion
-                in_inversion = False
-                inversion_periods.append((start_date, date))
-        
-        # Handle case where we're still in inversion
-        if in_inversion:
-            inversion_periods.append((start_date, self.data.index[-1]))
-        
+        starts, ends = _scan_inversions(self.data['2s10s_spread'].to_numpy())
+
+        # A period ends on the first normal day after it, or on the last
+        # observation if we're still in inversion
+        ends = np.minimum(ends, len(self.data) - 1)
+        inversion_periods = list(zip(self.data.index[starts], self.data.index[ends]))
+
         print("\n" + "="*50)
         print("YIELD CURVE INVERSION ANALYSIS")
         print("="*50)
@@ -444,28 +593,30 @@ class YieldCurveAnalyzer:
         if '2s10s_spread' in self.data.columns:
             print("\n📈 SPREAD ANALYSIS:")
             current_spread = self.data['2s10s_spread'].iloc[-1]
-            max_spread = self.data['2s10s_spread'].max()
-            min_spread = self.data['2s10s_spread'].min()
-            avg_spread = self.data['2s10s_spread'].mean()
+            stats = self.data['2s10s_spread'].agg(['min', 'max', 'mean', 'std'])
             
             print(f"  Current 2s10s spread: {current_spread:.2f} bp")
-            print(f"  Average spread: {avg_spread:.2f} bp")
-            print(f"  Maximum spread: {max_spread:.2f} bp")
-            print(f"  Minimum spread: {min_spread:.2f} bp")
+            print(f"  Average spread: {stats['mean']:.2f} bp")
+            print(f"  Maximum spread: {stats['max']:.2f} bp")
+            print(f"  Minimum spread: {stats['min']:.2f} bp")
             
             # Volatility
-            spread_std = self.data['2s10s_spread'].std()
-            print(f"  Spread volatility (std dev): {spread_std:.2f} bp")
+            print(f"  Spread volatility (std dev): {stats['std']:.2f} bp")
 
 def main():
     """
     Main function to run the yield curve analysis
     """
+    parser = argparse.ArgumentParser(description="Analyze US Treasury yield curves and spreads")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print step-by-step progress while fetching data")
+    args = parser.parse_args()
+    
     print("🏦 Welcome to the Yield Curve Analyzer!")
     print("This tool will help you understand Treasury yield curves and spreads.\n")
     
     # Create analyzer instance
-    analyzer = YieldCurveAnalyzer()
+    analyzer = YieldCurveAnalyzer(verbose=args.verbose)
     
     # Fetch data
     print("Attempting to fetch Treasury data from Yahoo Finance...")